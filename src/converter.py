@@ -4,47 +4,83 @@ Video conversion logic - Converts standard videos to YouTube Shorts format (9:16
 
 import logging
 import subprocess
+import tempfile
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List, Optional
+
+from overlay import subtitle_filter
+from utils import cache_key, cache_key_file, is_cached, save_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Video encoder arguments for each --encoder choice
+# - x264: CPU encode, tuned with --preset
+# - nvenc: NVIDIA GPUs
+# - videotoolbox: macOS
+# - vaapi: Intel/AMD GPUs on Linux
+ENCODERS = {
+    "x264": ["-c:v", "libx264", "-crf", "23"],
+    "nvenc": ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "23", "-b:v", "0"],
+    "videotoolbox": ["-c:v", "h264_videotoolbox", "-q:v", "55"],
+    "vaapi": ["-c:v", "h264_vaapi", "-qp", "23"],
+}
+
+# Render device used by the VAAPI encoder
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+# Lines of FFmpeg stderr kept for error messages
+FFMPEG_ERROR_LINES = 20
+
+# Audio codecs that can be stream-copied into an MP4 without re-encoding
+MP4_AUDIO_CODECS = {"aac", "mp3", "ac3", "eac3", "alac"}
 
-def convert_to_short(input_video: Path, output_dir: Path, duration: int = 30) -> Path:
+
+@lru_cache(maxsize=None)
+def _video_duration(input_video: Path) -> float:
     """
-    Convert a video to YouTube Shorts format (1080x1920, vertical).
+    Read a video's duration from its container metadata.
 
-    Creates a vertical video with:
-    - Last N seconds extracted (or full video if shorter)
-    - Blurred background (scaled and cropped to 1080x1920)
-    - Centered foreground (scaled to fit within frame)
+    Uses PyAV (installed with faster-whisper) to avoid spawning ffprobe,
+    falling back to ffprobe if it isn't available. Results are cached per
+    path for the life of the process.
 
     Args:
         input_video: Path to input video file
-        output_dir: Directory to save output
-        duration: Duration in seconds to extract from end (default: 30)
 
     Returns:
-        Path to the converted video file
+        Duration in seconds
     """
-    output_file = output_dir / f"{input_video.stem}_short.mp4"
+    try:
+        import av
+    except ImportError:
+        duration_cmd = [
+            "ffprobe",
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(input_video)
+        ]
+        result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
+        return float(result.stdout.strip())
 
-    # Skip if already exists
-    if output_file.exists():
-        logger.info(f"  ⚠ Short video already exists: {output_file.name}")
-        return output_file
+    with av.open(str(input_video)) as container:
+        return container.duration / av.time_base
 
-    # Get video duration first
-    duration_cmd = [
-        "ffprobe",
-        "-v", "error",
-        "-show_entries", "format=duration",
-        "-of", "default=noprint_wrappers=1:nokey=1",
-        str(input_video)
-    ]
 
+def get_start_time(input_video: Path, duration: int = 30) -> float:
+    """
+    Find where the last N seconds of a video begin.
+
+    Args:
+        input_video: Path to input video file
+        duration: Duration in seconds to extract from end (default: 30)
+
+    Returns:
+        Start time in seconds (0 if the duration can't be determined)
+    """
     try:
-        result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
-        total_duration = float(result.stdout.strip())
+        total_duration = _video_duration(input_video)
 
         # Calculate start time (last N seconds, or 0 if video is shorter)
         start_time = max(0, total_duration - duration)
@@ -54,47 +90,271 @@ def convert_to_short(input_video: Path, output_dir: Path, duration: int = 30) ->
         logger.warning(f"Could not determine video duration, processing full video: {e}")
         start_time = 0
 
+    return start_time
+
+
+@lru_cache(maxsize=None)
+def get_audio_codec(input_video: Path) -> Optional[str]:
+    """
+    Get the codec of a video's first audio stream (cached per path).
+
+    Args:
+        input_video: Path to input video file
+
+    Returns:
+        Codec name as ffprobe reports it (e.g. "aac"), or None if there is no
+        audio or probing failed
+    """
+    try:
+        import av
+    except ImportError:
+        av = None
+
+    try:
+        if av is not None:
+            with av.open(str(input_video)) as container:
+                audio_streams = container.streams.audio
+                # The codec's canonical name, not the decoder's (e.g. "mp3", not "mp3float")
+                return audio_streams[0].codec_context.codec.canonical_name if audio_streams else None
+
+        codec_cmd = [
+            "ffprobe",
+            "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(input_video)
+        ]
+        result = subprocess.run(codec_cmd, capture_output=True, text=True, check=True)
+        return result.stdout.strip() or None
+    except Exception as e:
+        logger.debug(f"Could not determine audio codec: {e}")
+        return None
+
+
+def _run_ffmpeg(cmd: List[str], duration: float) -> str:
+    """
+    Run FFmpeg, logging encode progress as it is reported.
+
+    Progress is read from FFmpeg's -progress output on stdout, so the loop
+    blocks on the pipe instead of polling. Stderr goes to a temporary file
+    so it can't fill up a pipe and stall the encode. Unless debug logging
+    is enabled, FFmpeg only reports errors and just the last
+    FFMPEG_ERROR_LINES lines are kept.
+
+    Args:
+        cmd: FFmpeg command line
+        duration: Expected output duration in seconds, for the percentage
+
+    Returns:
+        FFmpeg's stderr output
+
+    Raises:
+        subprocess.CalledProcessError: If FFmpeg exits with an error
+    """
+    verbose = logger.isEnabledFor(logging.DEBUG)
+    log_args = [] if verbose else ["-loglevel", "error"]
+    cmd = [cmd[0], "-progress", "pipe:1", "-nostats", *log_args, *cmd[1:]]
+
+    with tempfile.TemporaryFile() as stderr:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, text=True) as process:
+            for line in process.stdout:
+                if not verbose:
+                    continue
+                key, _, value = line.strip().partition("=")
+                if key == "out_time_us" and value.isdigit() and duration > 0:
+                    progress = min(100, int(value) / 1e6 / duration * 100)
+                    logger.debug(f"  Encode progress: {progress:.0f}%")
+
+        stderr.seek(0)
+        output = stderr.read().decode(errors="replace")
+
+    if not verbose:
+        output = "\n".join(output.splitlines()[-FFMPEG_ERROR_LINES:])
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stderr=output)
+
+    return output
+
+
+def get_output_path(input_video: Path, output_dir: Path, subtitled: bool = True) -> Path:
+    """
+    Get the path of the final Short for an input video.
+
+    Args:
+        input_video: Path to input video file
+        output_dir: Directory to save output
+        subtitled: Whether the Short has burned-in subtitles
+
+    Returns:
+        Path to the final video file
+    """
+    suffix = "_short_subs" if subtitled else "_short"
+    return output_dir / f"{input_video.stem}{suffix}.mp4"
+
+
+def get_cache_key(
+    input_video: Path,
+    duration: int = 30,
+    preset: str = "faster",
+    encoder: str = "x264",
+    subtitle_params: Optional[Dict] = None
+) -> str:
+    """
+    Get the cache key of a Short made with the given settings.
+
+    Args:
+        input_video: Path to input video file
+        duration: Duration in seconds to extract from end
+        preset: libx264 encoding preset
+        encoder: Video encoder, one of ENCODERS
+        subtitle_params: Settings the subtitles were generated with, or None without subtitles
+
+    Returns:
+        Cache key for the output video
+    """
+    return cache_key(input_video, {
+        "duration": duration,
+        "preset": preset,
+        "encoder": encoder,
+        "subtitles": subtitle_params,
+    })
+
+
+def convert_and_burn(
+    input_video: Path,
+    subtitle_file: Optional[Path],
+    output_dir: Path,
+    duration: int = 30,
+    start_time: Optional[float] = None,
+    preset: str = "faster",
+    threads: Optional[int] = None,
+    encoder: str = "x264",
+    hwaccel: str = "auto",
+    subtitle_params: Optional[Dict] = None
+) -> Path:
+    """
+    Convert a video to YouTube Shorts format and burn subtitles in one pass.
+
+    Creates a vertical video with:
+    - Last N seconds extracted (or full video if shorter)
+    - Blurred background (scaled and cropped to 720x1280)
+    - Centered foreground (scaled to fit within frame)
+    - Subtitles from subtitle_file burned in (if provided)
+
+    Args:
+        input_video: Path to input video file
+        subtitle_file: Path to .ass subtitle file, or None to skip subtitles
+        output_dir: Directory to save output
+        duration: Duration in seconds to extract from end (default: 30)
+        start_time: Clip start time in seconds (probed from input if None)
+        preset: libx264 encoding preset (default: faster)
+        threads: Threads FFmpeg may use (default: all cores)
+        encoder: Video encoder, one of ENCODERS (default: x264)
+        hwaccel: FFmpeg hardware decoder for the source, or "none" (default: auto)
+        subtitle_params: Settings the subtitles were generated with, so changing
+            them invalidates an existing output
+
+    Returns:
+        Path to the converted video file
+    """
+    output_file = get_output_path(input_video, output_dir, subtitled=subtitle_file is not None)
+    key = get_cache_key(
+        input_video,
+        duration=duration,
+        preset=preset,
+        encoder=encoder,
+        subtitle_params=subtitle_params if subtitle_file is not None else None
+    )
+
+    # Skip if already made from the same input and settings
+    if is_cached(output_file, key):
+        logger.info(f"  ⚠ Short video already exists: {output_file.name}")
+        return output_file
+
+    # Drop the old key first: FFmpeg truncates the old output, so a failed
+    # or interrupted encode must not leave it looking cached
+    cache_key_file(output_file).unlink(missing_ok=True)
+
+    if start_time is None:
+        start_time = get_start_time(input_video, duration)
+
     # FFmpeg command to create vertical short with blurred background
     # Filter breakdown:
     # [0:v] split into two streams
-    # - One for blurred background (scale, crop, blur)
-    # - One for main content (scale to fit)
-    # Then overlay main content on blurred background
-
-    cmd = [
-    "ffmpeg",
-    "-ss", str(start_time),  # Start from calculated position
-    "-i", str(input_video),
-    "-t", str(duration),  # Extract specified duration
-    "-filter_complex",
-    (
+    # - One for blurred background (fill and crop to 720x1280, then
+    #   shrink 16x and upscale, a cheap blur)
+    # - One for main content (scale to the 720 output width)
+    # Then overlay main content on blurred background and burn subtitles,
+    # all at output size in a single encode. The overlay position is
+    # evaluated once (eval=init) and blended in yuv420 to avoid a per-frame
+    # pixel format conversion
+    video_filter = (
         "[0:v]split=2[bg][fg];"
-        "[bg]scale=2276:1280,boxblur=4[blurred];"
-        "[fg]scale=1080:-1[scaled];"
-        "[blurred][scaled]overlay=(W-w)/2:(H-h)/2[tmp];"
-        "[tmp]crop=720:1280:(2276-720)/2:0"
-    ),
-    "-c:v", "libx264",
-    "-preset", "medium",
-    "-crf", "23",
-    "-c:a", "aac",
-    "-b:a", "128k",
-    "-ar", "44100",
-    "-y",  # Overwrite output
-    str(output_file)
-]
+        "[bg]scale=720:1280:force_original_aspect_ratio=increase,crop=720:1280,"
+        "scale=iw/16:ih/16,scale=720:1280:flags=bilinear[blurred];"
+        "[fg]scale=720:-1[scaled];"
+        "[blurred][scaled]overlay=x=(W-w)/2:y=(H-h)/2:eval=init:format=yuv420"
+    )
+    if subtitle_file is not None:
+        video_filter += f",{subtitle_filter(subtitle_file)}"
+    if encoder == "vaapi":
+        # Upload the composited frames to the GPU for encoding
+        video_filter += ",format=nv12,hwupload"
+    video_filter += "[v]"
+
+    encoder_args = list(ENCODERS[encoder])
+    if encoder == "x264":
+        encoder_args += ["-preset", preset]
+        if threads:
+            # Cap x264's own thread pool too, keeping frame-based threading
+            encoder_args += ["-x264-params", f"threads={threads}:sliced-threads=0"]
+
+    # Without a limit FFmpeg sizes its thread pools to every core, which
+    # oversubscribes the CPU when several jobs run at once
+    thread_args = []
+    if threads:
+        thread_args = ["-threads", str(threads), "-filter_complex_threads", str(threads)]
+
+    # Copy the source audio when the MP4 can hold it, otherwise encode once to AAC
+    if get_audio_codec(input_video) in MP4_AUDIO_CODECS:
+        audio_args = ["-c:a", "copy"]
+    else:
+        audio_args = ["-c:a", "aac", "-b:a", "128k"]
+
+    cmd = ["ffmpeg"]
+    if encoder == "vaapi":
+        cmd += ["-vaapi_device", VAAPI_DEVICE]
+
+    # Decode the source on the GPU when possible, freeing the CPU for x264;
+    # FFmpeg falls back to software decoding if no hwaccel works
+    if hwaccel != "none":
+        cmd += ["-hwaccel", hwaccel]
+
+    cmd += [
+        "-ss", str(start_time),  # Start from calculated position
+        "-i", str(input_video),
+        "-t", str(duration),  # Extract specified duration
+        "-filter_complex", video_filter,
+        "-map", "[v]",
+        "-map", "0:a:0?",  # Only the first audio track, the one get_audio_codec checked
+        *encoder_args,
+        *thread_args,
+        *audio_args,
+        "-movflags", "+faststart",  # Put the moov atom first so playback/upload can start immediately
+        "-y",  # Overwrite output
+        str(output_file)
+    ]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        logger.debug(f"FFmpeg output: {result.stderr}")
+        output = _run_ffmpeg(cmd, duration)
+        logger.debug(f"FFmpeg output: {output}")
 
     except subprocess.CalledProcessError as e:
         logger.error(f"FFmpeg conversion failed: {e.stderr}")
         raise RuntimeError(f"Failed to convert video: {e}")
 
+    save_cache_key(output_file, key)
+
     return output_file
@@ -5,14 +5,114 @@ shortgen CLI - Main entry point for the video conversion tool.
 
 import argparse
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
 
-from converter import convert_to_short
+from converter import ENCODERS, convert_and_burn, get_cache_key, get_output_path, get_start_time
 from subtitles import generate_subtitles
-from overlay import burn_subtitles
-from uploader import upload_to_youtube
-from utils import setup_logging, get_video_files
+from uploader import DEFAULT_UPLOAD_WORKERS, upload_many_to_youtube
+from utils import cache_key_file, is_cached, setup_logging, get_video_files
+
+logger = logging.getLogger(__name__)
+
+# Threads each job gets when picking the default --jobs
+DEFAULT_THREADS_PER_JOB = 4
+
+
+def threads_per_job(jobs: int) -> int:
+    """
+    Split the available CPU cores between parallel jobs.
+
+    Args:
+        jobs: Number of videos processed at once
+
+    Returns:
+        Number of threads each job's FFmpeg and Whisper may use
+    """
+    return max(1, (os.cpu_count() or 1) // jobs)
+
+
+def process_one(video_file: Path, args: argparse.Namespace) -> Optional[Path]:
+    """
+    Convert a single video to a Short with subtitles.
+
+    Runs in a worker process when --jobs is greater than 1.
+
+    Args:
+        video_file: Path to input video file
+        args: Parsed command line arguments
+
+    Returns:
+        Path to the final video, or None if processing failed
+    """
+    output_dir = Path(args.output)
+    logger.info(f"Processing: {video_file.name}")
+
+    try:
+        final_video = get_output_path(video_file, output_dir, subtitled=not args.no_subs)
+        subtitle_params = None if args.no_subs else {"model": args.model, "max_words": args.max_words}
+        key = get_cache_key(
+            video_file,
+            duration=args.duration,
+            preset=args.preset,
+            encoder=args.encoder,
+            subtitle_params=subtitle_params
+        )
+
+        if is_cached(final_video, key):
+            logger.info(f"  ⚠ Short video already exists: {final_video.name}")
+        else:
+            start_time = get_start_time(video_file, duration=args.duration)
+            subtitle_file = None
+
+            # Step 1: Generate subtitles from the clip's audio (unless disabled)
+            if not args.no_subs:
+                logger.info("  → Generating subtitles...")
+                subtitle_file = generate_subtitles(
+                    video_file,
+                    model=args.model,
+                    use_gpu=args.gpu,
+                    max_words=args.max_words,
+                    output_file=output_dir / f"{video_file.stem}_short.ass",
+                    start_time=start_time,
+                    duration=args.duration,
+                    threads=threads_per_job(args.jobs)
+                )
+                logger.info(f"  ✓ Created: {subtitle_file.name}")
+
+            # Step 2: Convert to vertical short format and burn subtitles in one pass
+            logger.info("  → Converting to Shorts format...")
+            final_video = convert_and_burn(
+                video_file,
+                subtitle_file,
+                output_dir,
+                duration=args.duration,
+                start_time=start_time,
+                preset=args.preset,
+                threads=threads_per_job(args.jobs),
+                encoder=args.encoder,
+                hwaccel=args.hwaccel,
+                subtitle_params=subtitle_params
+            )
+            logger.info(f"  ✓ Created: {final_video.name}")
+
+            # Cleanup intermediate files if requested
+            if subtitle_file is not None and not args.keep_temp:
+                logger.debug("  → Cleaning up intermediate files...")
+                subtitle_file.unlink()
+                cache_key_file(subtitle_file).unlink(missing_ok=True)
+
+        logger.info(f"✓ Completed: {final_video}")
+        return final_video
+
+    except Exception as e:
+        logger.error(f"✗ Failed to process {video_file.name}: {e}")
+        if args.verbose:
+            logger.exception(e)
+        return None
 
 
 def main():
@@ -51,7 +151,7 @@ def main():
     parser.add_argument(
         "--keep-temp",
         action="store_true",
-        help="Keep intermediate files (vertical video, .srt)"
+        help="Keep intermediate files (.ass subtitles)"
     )
 
     parser.add_argument(
@@ -74,6 +174,36 @@ def main():
         help="Clip duration in seconds (extracts from end of video, default: 30)"
     )
 
+    parser.add_argument(
+        "--preset",
+        type=str,
+        choices=["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow", "slower", "veryslow"],
+        default="faster",
+        help="libx264 encoding preset, slower presets compress better (default: faster)"
+    )
+
+    parser.add_argument(
+        "--encoder",
+        type=str,
+        choices=list(ENCODERS),
+        default="x264",
+        help="Video encoder, nvenc/videotoolbox/vaapi use the GPU (default: x264)"
+    )
+
+    parser.add_argument(
+        "--hwaccel",
+        type=str,
+        default="auto",
+        help="Hardware decoder for source videos (e.g. cuda, videotoolbox, vaapi), or 'none' (default: auto)"
+    )
+
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=max(1, (os.cpu_count() or 1) // DEFAULT_THREADS_PER_JOB),
+        help=f"Number of videos to process in parallel (default: CPU cores / {DEFAULT_THREADS_PER_JOB})"
+    )
+
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -114,6 +244,21 @@ def main():
         help="Privacy status for YouTube upload (default: private)"
     )
 
+    parser.add_argument(
+        "--upload-workers",
+        type=int,
+        default=DEFAULT_UPLOAD_WORKERS,
+        help=f"Number of videos to upload to YouTube at once (default: {DEFAULT_UPLOAD_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--api-host",
+        type=str,
+        default=None,
+        help="Host to send YouTube API requests and uploads to, or 'auto' to use the "
+             "one with the lowest latency (default: the API client's default)"
+    )
+
     parser.add_argument(
         "--credentials",
         type=str,
@@ -125,7 +270,6 @@ def main():
 
     # Setup logging
     setup_logging(verbose=args.verbose)
-    logger = logging.getLogger(__name__)
 
     # Get input path
     input_path = Path(args.input)
@@ -147,73 +291,61 @@ def main():
 
     logger.info(f"Found {len(video_files)} video(s) to process")
 
-    # Process each video
-    for video_file in video_files:
-        logger.info(f"Processing: {video_file.name}")
-
-        try:
-            # Step 1: Convert to vertical short format (extracts last N seconds)
-            logger.info("  → Converting to Shorts format...")
-            short_video = convert_to_short(video_file, output_dir, duration=args.duration)
-            logger.info(f"  ✓ Created: {short_video.name}")
-
-            # Step 2: Generate subtitles (unless disabled)
-            if not args.no_subs:
-                logger.info("  → Generating subtitles...")
-                srt_file = generate_subtitles(
-                    short_video,
-                    model=args.model,
-                    use_gpu=args.gpu,
-                    max_words=args.max_words
-                )
-                logger.info(f"  ✓ Created: {srt_file.name}")
-
-                # Step 3: Burn subtitles onto video
-                logger.info("  → Burning subtitles...")
-                final_video = burn_subtitles(short_video, srt_file, output_dir)
-                logger.info(f"  ✓ Created: {final_video.name}")
-
-                # Cleanup intermediate files if requested
-                if not args.keep_temp:
-                    logger.debug("  → Cleaning up intermediate files...")
-                    short_video.unlink()
-                    srt_file.unlink()
+    # Don't split cores between more jobs than there are videos
+    args.jobs = max(1, min(args.jobs, len(video_files)))
+
+    # Process videos, several at a time if requested
+    if args.jobs > 1:
+        logger.info(f"Processing with {args.jobs} parallel jobs")
+        with ProcessPoolExecutor(
+            max_workers=args.jobs,
+            initializer=setup_logging,
+            initargs=(args.verbose,)
+        ) as executor:
+            futures = [executor.submit(process_one, video_file, args) for video_file in video_files]
+
+            # Collect each result separately, so a crashed worker (e.g. one
+            # killed for running out of memory) only fails the videos that
+            # hadn't finished, and the finished ones still get uploaded
+            final_videos = []
+            for video_file, future in zip(video_files, futures):
+                try:
+                    final_videos.append(future.result())
+                except Exception as e:
+                    logger.error(f"✗ Failed to process {video_file.name}: {e}")
+                    if args.verbose:
+                        logger.exception(e)
+                    final_videos.append(None)
+    else:
+        final_videos = [process_one(video_file, args) for video_file in video_files]
+
+    # Upload to YouTube (if requested)
+    if args.upload:
+        upload_files = [final_video for final_video in final_videos if final_video is not None]
+        logger.info(f"Uploading {len(upload_files)} video(s) to YouTube...")
+
+        # Parse tags if provided
+        tags = None
+        if args.tags:
+            tags = [tag.strip() for tag in args.tags.split(',')]
+
+        # Custom title, or each video's filename when not given
+        video_ids = upload_many_to_youtube(
+            upload_files,
+            title=args.title,
+            description=args.description,
+            tags=tags,
+            privacy_status=args.privacy,
+            credentials_file=args.credentials,
+            max_workers=args.upload_workers,
+            api_host=args.api_host
+        )
+
+        for final_video, video_id in zip(upload_files, video_ids):
+            if video_id:
+                logger.info(f"  ✓ Uploaded {final_video.name}: https://www.youtube.com/shorts/{video_id}")
             else:
-                final_video = short_video
-
-            logger.info(f"✓ Completed: {final_video}")
-
-            # Step 4: Upload to YouTube (if requested)
-            if args.upload:
-                logger.info("  → Uploading to YouTube...")
-
-                # Parse tags if provided
-                tags = None
-                if args.tags:
-                    tags = [tag.strip() for tag in args.tags.split(',')]
-
-                # Use custom title or default to filename
-                title = args.title if args.title else final_video.stem.replace('_', ' ').title()
-
-                video_id = upload_to_youtube(
-                    video_file=final_video,
-                    title=title,
-                    description=args.description,
-                    tags=tags,
-                    privacy_status=args.privacy,
-                    credentials_file=args.credentials
-                )
-
-                if video_id:
-                    logger.info(f"  ✓ Uploaded to YouTube: https://www.youtube.com/shorts/{video_id}")
-                else:
-                    logger.error(f"  ✗ Failed to upload to YouTube")
-
-        except Exception as e:
-            logger.error(f"✗ Failed to process {video_file.name}: {e}")
-            if args.verbose:
-                logger.exception(e)
-            continue
+                logger.error(f"  ✗ Failed to upload {final_video.name} to YouTube")
 
     logger.info("All videos processed!")
 
@@ -3,11 +3,62 @@ Subtitle generation using Whisper AI.
 """
 
 import logging
+import os
+import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from utils import cache_key, cache_key_file, is_cached, save_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Sample rate Whisper expects
+SAMPLE_RATE = 16000
+
+# Subtitle styling, written into the .ass [V4+ Styles] section
+# Sizes and margins are relative to the 384x288 script resolution below
+SUBTITLE_STYLE = {
+    "Fontname": "Montserrat ExtraBold",
+    "Fontsize": 30,
+    "PrimaryColour": "&H00FFFFFF",  # White text
+    "OutlineColour": "&H00000000",  # Black border
+    "BorderStyle": 1,               # Outline, no background box
+    "Outline": 1,                   # Thin outline
+    "Shadow": 1,                    # Subtle shadow
+    "Alignment": 2,                 # Bottom center
+    "MarginV": 40,                  # Padding from bottom
+}
+
+# Every field of an ASS style line, in order, with libass defaults
+_ASS_STYLE_FIELDS = {
+    "Name": "Default",
+    "Fontname": "Arial",
+    "Fontsize": 16,
+    "PrimaryColour": "&H00FFFFFF",
+    "SecondaryColour": "&H00FFFFFF",
+    "OutlineColour": "&H00000000",
+    "BackColour": "&H00000000",
+    "Bold": 0,
+    "Italic": 0,
+    "Underline": 0,
+    "StrikeOut": 0,
+    "ScaleX": 100,
+    "ScaleY": 100,
+    "Spacing": 0,
+    "Angle": 0,
+    "BorderStyle": 1,
+    "Outline": 1,
+    "Shadow": 0,
+    "Alignment": 2,
+    "MarginL": 10,
+    "MarginR": 10,
+    "MarginV": 10,
+    "Encoding": 0,
+}
+
 
 def split_into_chunks(words: List, max_words: int = 1) -> List[Dict]:
     """
@@ -21,68 +72,137 @@ def split_into_chunks(words: List, max_words: int = 1) -> List[Dict]:
         List of subtitle chunks with start, end, and text
     """
     chunks = []
-    current_chunk = []
-
-    for word in words:
-        current_chunk.append(word)
-
-        # Create chunk when we hit max words or at natural breaks
-        if len(current_chunk) >= max_words:
-            chunks.append({
-                'start': current_chunk[0].start,
-                'end': current_chunk[-1].end,
-                'text': ' '.join(w.word.strip() for w in current_chunk)
-            })
-            current_chunk = []
-
-    # Add remaining words as final chunk
-    if current_chunk:
+
+    # Each chunk is a max_words-long slice; the last one may be shorter
+    for i in range(0, len(words), max_words):
+        chunk = words[i:i + max_words]
         chunks.append({
-            'start': current_chunk[0].start,
-            'end': current_chunk[-1].end,
-            'text': ' '.join(w.word.strip() for w in current_chunk)
+            'start': chunk[0].start,
+            'end': chunk[-1].end,
+            'text': ' '.join(w.word.strip() for w in chunk)
         })
 
     return chunks
 
 
-def generate_subtitles(video_file: Path, model: str = "small", use_gpu: bool = False, max_words: int = 1) -> Path:
+def load_audio(media_file: Path, start_time: float = 0, duration: Optional[float] = None) -> np.ndarray:
     """
-    Generate .srt subtitles from video audio using Whisper.
+    Decode audio to the 16 kHz mono float32 samples Whisper expects.
+
+    FFmpeg writes raw PCM to a pipe so no intermediate audio file is needed.
+
+    Args:
+        media_file: Path to video or audio file
+        start_time: Start time in seconds
+        duration: Duration in seconds (default: until the end)
+
+    Returns:
+        Audio samples in the range [-1, 1]
+    """
+    cmd = ["ffmpeg", "-nostdin", "-loglevel", "error", "-ss", str(start_time), "-i", str(media_file)]
+    if duration is not None:
+        cmd += ["-t", str(duration)]
+    cmd += [
+        "-vn",  # Demux audio only, no video decode
+        "-f", "s16le",
+        "-ac", "1",
+        "-ar", str(SAMPLE_RATE),
+        "-"
+    ]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=True)
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Audio extraction failed: {e.stderr.decode(errors='replace')}")
+        raise RuntimeError(f"Failed to extract audio: {e}")
+
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+
+@lru_cache(maxsize=4)
+def _get_model(model: str, device: str, compute_type: str, cpu_threads: int = 0):
+    """
+    Load a Whisper model, reusing it across videos.
 
     Args:
-        video_file: Path to video file
+        model: Whisper model size (tiny, base, small, medium, large)
+        device: Device to run on (cpu or cuda)
+        compute_type: CTranslate2 compute type (int8, float16, ...)
+        cpu_threads: Threads used on CPU (0 for the library default)
+
+    Returns:
+        Loaded faster-whisper model
+    """
+    # Import here to avoid loading if not needed
+    from faster_whisper import WhisperModel
+
+    logger.debug(f"Loading Whisper model '{model}' on {device}")
+    return WhisperModel(model, device=device, compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+def generate_subtitles(
+    video_file: Path,
+    model: str = "small",
+    use_gpu: bool = False,
+    max_words: int = 1,
+    output_file: Optional[Path] = None,
+    start_time: float = 0,
+    duration: Optional[float] = None,
+    threads: Optional[int] = None
+) -> Path:
+    """
+    Generate .ass subtitles from video audio using Whisper.
+
+    Args:
+        video_file: Path to video or audio file
         model: Whisper model size (tiny, base, small, medium, large)
         use_gpu: Whether to use GPU acceleration
         max_words: Maximum words per subtitle line
+        output_file: Path to write the .ass file (default: next to video_file)
+        start_time: Start of the clip to transcribe in seconds
+        duration: Duration of the clip to transcribe in seconds (default: until the end)
+        threads: CPU threads for Whisper (default: all cores)
 
     Returns:
-        Path to generated .srt file
+        Path to generated .ass file
     """
-    output_file = video_file.with_suffix(".srt")
-
-    # Skip if already exists
-    if output_file.exists():
+    if output_file is None:
+        output_file = video_file.with_suffix(".ass")
+
+    key = cache_key(video_file, {
+        "model": model,
+        "max_words": max_words,
+        "start_time": start_time,
+        "duration": duration,
+    })
+
+    # Skip if already made from the same input and settings
+    if is_cached(output_file, key):
         logger.info(f"  ⚠ Subtitle file already exists: {output_file.name}")
         return output_file
 
-    try:
-        # Import here to avoid loading if not needed
-        from faster_whisper import WhisperModel
+    # Drop the old key first, so a failed or interrupted run can't leave an
+    # incomplete file that looks cached
+    cache_key_file(output_file).unlink(missing_ok=True)
 
+    try:
         # Select device
         device = "cuda" if use_gpu else "cpu"
         compute_type = "float16" if use_gpu else "int8"
 
-        logger.debug(f"Loading Whisper model '{model}' on {device}")
-        whisper_model = WhisperModel(model, device=device, compute_type=compute_type)
+        whisper_model = _get_model(model, device, compute_type, threads or os.cpu_count() or 0)
+
+        audio = load_audio(video_file, start_time=start_time, duration=duration)
 
         # Transcribe with word-level timestamps for better chunking
         logger.debug(f"Transcribing: {video_file.name}")
         segments, info = whisper_model.transcribe(
-            str(video_file),
-            beam_size=5,
-            word_timestamps=True  # Enable word timestamps for snappier subtitles
+            audio,
+            # Greedy decoding is close enough for small models and much cheaper
+            beam_size=1 if model in {"tiny", "base"} else 5,
+            word_timestamps=True,  # Enable word timestamps for snappier subtitles
+            vad_filter=True,  # Skip silent stretches instead of transcribing them
+            vad_parameters=dict(min_silence_duration_ms=500)
         )
 
         logger.debug(f"Detected language: {info.language} ({info.language_probability:.2f})")
@@ -100,8 +220,8 @@ def generate_subtitles(video_file: Path, model: str = "small", use_gpu: bool = F
                 if len(text.split()) > max_words:
                     # Split long text into smaller chunks
                     words = text.split()
-                    duration = segment.end - segment.start
-                    time_per_word = duration / len(words)
+                    segment_duration = segment.end - segment.start
+                    time_per_word = segment_duration / len(words)
 
                     for i in range(0, len(words), max_words):
                         chunk_words = words[i:i+max_words]
@@ -119,16 +239,8 @@ def generate_subtitles(video_file: Path, model: str = "small", use_gpu: bool = F
                         'text': text
                     })
 
-        # Write SRT file
-        with open(output_file, "w", encoding="utf-8") as srt:
-            for i, chunk in enumerate(subtitle_chunks, start=1):
-                start_time = format_timestamp(chunk['start'])
-                end_time = format_timestamp(chunk['end'])
-                text = chunk['text']
-
-                srt.write(f"{i}\n")
-                srt.write(f"{start_time} --> {end_time}\n")
-                srt.write(f"{text}\n\n")
+        write_ass(subtitle_chunks, output_file)
+        save_cache_key(output_file, key)
 
         logger.debug(f"Wrote {len(subtitle_chunks)} subtitle segments")
 
@@ -142,19 +254,65 @@ def generate_subtitles(video_file: Path, model: str = "small", use_gpu: bool = F
     return output_file
 
 
-def format_timestamp(seconds: float) -> str:
+def write_ass(chunks: List[Dict], output_file: Path, style: Optional[Dict] = None) -> None:
+    """
+    Write subtitle chunks to an .ass file with the styling embedded.
+
+    Args:
+        chunks: Subtitle chunks with start, end, and text
+        output_file: Path to write the .ass file
+        style: ASS style fields overriding the defaults (default: SUBTITLE_STYLE)
     """
-    Format seconds into SRT timestamp format (HH:MM:SS,mmm).
+    style_fields = {**_ASS_STYLE_FIELDS, **(SUBTITLE_STYLE if style is None else style)}
+
+    # Format all timestamps at once
+    start_times = format_timestamps([chunk['start'] for chunk in chunks])
+    end_times = format_timestamps([chunk['end'] for chunk in chunks])
+
+    header = (
+        "[Script Info]\n"
+        "ScriptType: v4.00+\n"
+        "PlayResX: 384\n"
+        "PlayResY: 288\n"
+        "ScaledBorderAndShadow: yes\n"
+        "\n"
+        "[V4+ Styles]\n"
+        f"Format: {', '.join(style_fields)}\n"
+        f"Style: {','.join(str(value) for value in style_fields.values())}\n"
+        "\n"
+        "[Events]\n"
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+    )
+
+    # ASS marks line breaks with \N rather than a newline
+    texts = [chunk['text'].replace("\n", r"\N") for chunk in chunks]
+
+    # Build the whole file in memory and write it once
+    events = "".join(
+        f"Dialogue: 0,{start_time},{end_time},{style_fields['Name']},,0,0,0,,{text}\n"
+        for text, start_time, end_time in zip(texts, start_times, end_times)
+    )
+    output_file.write_text(header + events, encoding="utf-8")
+
+
+def format_timestamps(seconds: List[float]) -> List[str]:
+    """
+    Format times in seconds into ASS timestamp format (H:MM:SS.cc).
 
     Args:
-        seconds: Time in seconds
+        seconds: Times in seconds
 
     Returns:
-        Formatted timestamp string
+        Formatted timestamp strings
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    # Round to the nearest centisecond (Whisper times like 0.29 aren't exact in binary)
+    centis_total = np.rint(np.asarray(seconds, dtype=np.float64) * 100).astype(np.int64)
+
+    hours, centis_total = np.divmod(centis_total, 360_000)
+    minutes, centis_total = np.divmod(centis_total, 6_000)
+    secs, centis = np.divmod(centis_total, 100)
 
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    return [
+        f"{h:d}:{m:02d}:{s:02d}.{cs:02d}"
+        for h, m, s, cs in zip(hours.tolist(), minutes.tolist(), secs.tolist(), centis.tolist())
+    ]
@@ -3,18 +3,32 @@
 YouTube uploader module - Handles uploading videos to YouTube as Shorts.
 """
 
+import json
 import logging
+import mmap
 import os
-import pickle
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
+from urllib.parse import urlsplit, urlunsplit
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+# The Google API client libraries take a few hundred milliseconds to
+# import, so they are imported where they're used rather than here. That
+# keeps startup fast for runs that never upload
+if TYPE_CHECKING:
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.http import HttpRequest, MediaIoBaseUpload
+    from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -24,21 +38,335 @@ SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
 # YouTube Shorts video category (22 = People & Blogs, adjust as needed)
 DEFAULT_CATEGORY_ID = '22'
 
+# Matches a #Shorts hashtag in any case
+_SHORTS_RE = re.compile(r'#shorts', re.IGNORECASE)
+
+# Resource parts sent with every upload (the keys of the request body)
+_UPLOAD_PARTS = 'snippet,status'
+
+# Files smaller than this are sent together with their metadata in one
+# multipart request, skipping the resumable upload session
+MULTIPART_UPLOAD_THRESHOLD = 5 * 1024 * 1024  # 5MB
+
+# Files smaller than this are sent in a single request rather than in chunks
+SMALL_UPLOAD_THRESHOLD = 100 * 1024 * 1024  # 100MB
+
+# Chunk size for resumable uploads of larger files
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB
+
+# Upload progress is logged each time it advances by this many percent
+PROGRESS_LOG_STEP = 10
+
+# Number of videos uploaded at once by upload_many
+DEFAULT_UPLOAD_WORKERS = 4
+
+# Timeout for API requests, in seconds (matches googleapiclient's default)
+HTTP_TIMEOUT = 60
+
+# Hosts serving the YouTube Data API (and its uploads), probed when the
+# API host is "auto"
+API_HOSTS = ['youtube.googleapis.com', 'www.googleapis.com']
+
+# Where the probed host is remembered, and for how long
+# (relative to the home directory)
+API_HOST_CACHE_PATH = Path('.cache') / 'short-gen' / 'api-host'
+API_HOST_CACHE_MAX_AGE = 24 * 60 * 60  # 1 day
+
+# Timeout for each host probe, in seconds
+API_HOST_PROBE_TIMEOUT = 5
+
+# Read size when streaming a file body through the pooled HTTP client
+_STREAM_BLOCK_SIZE = 64 * 1024
+
+
+def _new_session():
+    """
+    Create a pooled HTTP/2 client shared by all requests of an uploader.
+
+    Returns:
+        httpx.Client, or None if httpx isn't installed
+    """
+    try:
+        import httpx
+    except ImportError:
+        logger.debug("httpx not installed, using httplib2 connections")
+        return None
+
+    limits = httpx.Limits(max_keepalive_connections=16)
+
+    try:
+        return httpx.Client(http2=True, timeout=HTTP_TIMEOUT, limits=limits)
+    except ImportError:
+        # HTTP/2 support needs the h2 package (pip install httpx[http2])
+        return httpx.Client(timeout=HTTP_TIMEOUT, limits=limits)
+
+
+def _probe_rtt(session, host: str) -> float:
+    """Time a HEAD request to a host, in seconds (infinite if it fails)."""
+    start = time.perf_counter()
+    try:
+        session.head(f"https://{host}/", timeout=API_HOST_PROBE_TIMEOUT)
+    except Exception as e:
+        logger.debug(f"API host probe failed for {host}: {e}")
+        return float('inf')
+    return time.perf_counter() - start
+
+
+def _fastest_api_host(session) -> Optional[str]:
+    """
+    Pick the API host with the lowest round-trip time.
+
+    Hosts are probed in parallel and the choice is cached in
+    ~/API_HOST_CACHE_PATH for API_HOST_CACHE_MAX_AGE. Probing also leaves a
+    warm connection to the chosen host in the session's pool.
+
+    Args:
+        session: Pooled httpx.Client used for the probes, or None
+
+    Returns:
+        Host name, or None to use the API client's default
+    """
+    try:
+        cache_file = Path.home() / API_HOST_CACHE_PATH
+    except RuntimeError:
+        # No home directory (e.g. a container user without a passwd entry)
+        cache_file = None
+
+    try:
+        if cache_file is not None and time.time() - cache_file.stat().st_mtime < API_HOST_CACHE_MAX_AGE:
+            host = cache_file.read_text().strip()
+            if host in API_HOSTS:
+                logger.debug(f"Using cached API host: {host}")
+                return host
+    except OSError:
+        pass
+
+    if session is None:
+        logger.debug("httpx not installed, using the default API host")
+        return None
+
+    with ThreadPoolExecutor(max_workers=len(API_HOSTS)) as executor:
+        rtts = list(executor.map(lambda host: _probe_rtt(session, host), API_HOSTS))
+
+    rtt, host = min(zip(rtts, API_HOSTS))
+    if rtt == float('inf'):
+        logger.warning("Could not reach any API host, using the default")
+        return None
+
+    logger.debug(f"Fastest API host: {host} ({rtt * 1000:.0f} ms)")
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(host)
+        except OSError as e:
+            logger.debug(f"Failed to cache API host: {e}")
+
+    return host
+
+
+class _PooledHttp:
+    """
+    httplib2.Http-compatible adapter over a shared httpx.Client.
+
+    googleapiclient and google-auth-httplib2 only call request(), so this lets
+    every API call and upload chunk reuse the client's pooled HTTP/2
+    connections instead of opening a new TLS connection.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.timeout = HTTP_TIMEOUT
+        # Never follow redirects (the resumable protocol uses 308 for "resume incomplete")
+        self.follow_redirects = False
+        self.redirect_codes = set()
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=None, connection_type=None):
+        import httplib2
+
+        # Stream file bodies in blocks rather than line by line
+        if hasattr(body, 'read'):
+            stream = body
+            body = iter(lambda: stream.read(_STREAM_BLOCK_SIZE), b'')
+
+        response = self.session.request(method, uri, content=body, headers=headers)
+        info = {'status': str(response.status_code), **dict(response.headers.items())}
+
+        return httplib2.Response(info), response.content
+
+
+def _advise(mapped: mmap.mmap, advice_name: str, start: int = 0, length: Optional[int] = None) -> None:
+    """Pass a madvise() hint for part of a mapping, where the platform supports it."""
+    advice = getattr(mmap, advice_name, None)
+    if advice is None or not hasattr(mapped, 'madvise'):
+        return
+
+    # madvise needs a page-aligned start
+    aligned_start = start - start % mmap.PAGESIZE
+    end = len(mapped) if length is None else min(len(mapped), start + length)
+    if aligned_start < end:
+        mapped.madvise(advice, aligned_start, end - aligned_start)
+
+
+@contextmanager
+def _map_file(video_file: Path) -> Iterator[mmap.mmap]:
+    """Memory-map a file read-only for uploading."""
+    with open(video_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        # The upload reads front to back, so let the kernel read ahead aggressively
+        _advise(mapped, 'MADV_SEQUENTIAL')
+        yield mapped
+
+
+@lru_cache(maxsize=None)
+def _mapped_media_upload_class() -> type:
+    """Define the memory-mapped media upload class (on first use, see imports)."""
+    from googleapiclient.http import MediaIoBaseUpload
+
+    class _MappedMediaUpload(MediaIoBaseUpload):
+        """
+        Upload straight from a memory-mapped file.
+
+        Single-request uploads hand the mapping itself to the HTTP client,
+        which streams it in blocks, so the file is never copied into memory
+        as a whole. Chunked uploads slice each chunk out of the mapping. The
+        kernel is asked to start reading ahead before data is needed: the
+        first chunk while the upload session is created, the next one while
+        the current one is sent. (The resumable protocol only accepts chunks
+        in order, so they can't be sent in parallel.)
+        """
+
+        def __init__(self, mapped: mmap.mmap, chunksize: int, resumable: bool):
+            super().__init__(mapped, mimetype='video/*', chunksize=chunksize, resumable=resumable)
+            self._mapped = mapped
+
+            # Start reading the first chunk while the upload session is created
+            _advise(mapped, 'MADV_WILLNEED', 0, chunksize if chunksize > 0 else None)
+
+        def has_stream(self) -> bool:
+            # Send the whole mapping as a stream in single-request uploads;
+            # chunks of larger files are fetched through getbytes()
+            return self.chunksize() == -1
+
+        def stream(self) -> mmap.mmap:
+            return self._mapped
+
+        def getbytes(self, begin: int, length: int) -> bytes:
+            end = len(self._mapped) if length < 0 else begin + length
+            data = self._mapped[begin:end]
+
+            if length > 0:
+                _advise(self._mapped, 'MADV_WILLNEED', begin + len(data), length)
+
+            return data
+
+    return _MappedMediaUpload
+
+
+def _mapped_media_upload(mapped: mmap.mmap, chunksize: int, resumable: bool = True) -> 'MediaIoBaseUpload':
+    """Create a media upload that reads chunks from a memory-mapped file."""
+    return _mapped_media_upload_class()(mapped, chunksize, resumable)
+
+
+def _json_model() -> 'JsonModel':
+    """Get the model used to encode API requests, using orjson when it's installed."""
+    from googleapiclient.model import JsonModel
+
+    if orjson is None:
+        return JsonModel()
+
+    class _OrjsonModel(JsonModel):
+        """JsonModel that serializes request bodies with orjson instead of json."""
+
+        def serialize(self, body_value):
+            if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+                body_value = {'data': body_value}
+            return orjson.dumps(body_value).decode()
+
+    return _OrjsonModel()
+
+
+def _default_title(video_file: Path) -> str:
+    """Make a video title from a file name."""
+    return video_file.stem.replace('_', ' ').title()
+
 
 class YouTubeUploader:
     """Handles YouTube authentication and video uploads."""
 
-    def __init__(self, credentials_file: str = 'client_secrets.json', token_file: str = 'token.pickle'):
+    def __init__(
+        self,
+        credentials_file: str = 'client_secrets.json',
+        token_file: str = 'token.json',
+        api_host: Optional[str] = None
+    ):
         """
         Initialize the YouTube uploader.
 
         Args:
             credentials_file: Path to OAuth2 client secrets JSON file
             token_file: Path to save/load the authentication token
+            api_host: Host to send API requests and uploads to, "auto" to
+                pick the fastest of API_HOSTS, or None for the API client's default
         """
         self.credentials_file = credentials_file
         self.token_file = token_file
+        self.api_host = api_host
         self.youtube = None
+        self._credentials = None
+        self._saved_token = None
+        self._token_lock = threading.Lock()
+        self._local = threading.local()
+        self._session = _new_session()
+        self._request_host = None
+
+    def _authorized_http(self) -> 'AuthorizedHttp':
+        """
+        Create an HTTP connection that authorizes requests with the cached token.
+
+        The access token is only refreshed when it expires or the API rejects
+        it with a 401, not on every request. Connections come from the shared
+        HTTP/2 pool when httpx is available.
+        """
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+
+        http = _PooledHttp(self._session) if self._session is not None else httplib2.Http(timeout=HTTP_TIMEOUT)
+        return AuthorizedHttp(self._credentials, http=http, refresh_status_codes=(401,))
+
+    def _save_credentials(self) -> None:
+        """Save the credentials (including the current access token and expiry) to the token file."""
+        with self._token_lock:
+            if self._credentials.token == self._saved_token:
+                return
+
+            try:
+                Path(self.token_file).write_text(self._credentials.to_json())
+                self._saved_token = self._credentials.token
+            except OSError as e:
+                logger.warning(f"Failed to save authentication token: {e}")
+
+    def _build_request(self, http, postproc, uri: str, *args, **kwargs) -> 'HttpRequest':
+        """
+        Build API requests on a per-thread HTTP connection.
+
+        httplib2.Http isn't thread-safe, so each upload thread gets its own
+        authorized HTTP object, which is then reused for that thread's
+        requests. With httpx they all share one connection pool.
+
+        Requests are sent to the chosen API host, if any. The host is
+        swapped here rather than with client_options, because googleapiclient
+        builds upload URLs from the discovery document's root URL.
+        """
+        from googleapiclient.http import HttpRequest
+
+        if self._request_host is not None:
+            parts = urlsplit(uri)
+            if parts.netloc in API_HOSTS:
+                uri = urlunsplit(parts._replace(netloc=self._request_host))
+
+        if not hasattr(self._local, 'http'):
+            self._local.http = self._authorized_http()
+        return HttpRequest(self._local.http, postproc, uri, *args, **kwargs)
 
     def authenticate(self) -> bool:
         """
@@ -47,12 +375,22 @@ class YouTubeUploader:
         Returns:
             True if authentication successful, False otherwise
         """
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
+
         creds = None
 
         # Load existing token if available
         if os.path.exists(self.token_file):
-            with open(self.token_file, 'rb') as token:
-                creds = pickle.load(token)
+            try:
+                token_data = Path(self.token_file).read_bytes()
+                token_info = orjson.loads(token_data) if orjson is not None else json.loads(token_data)
+                creds = Credentials.from_authorized_user_info(token_info, SCOPES)
+                self._saved_token = creds.token
+            except ValueError as e:
+                logger.warning(f"Ignoring unreadable authentication token: {e}")
 
         # If no valid credentials, authenticate
         if not creds or not creds.valid:
@@ -82,13 +420,31 @@ class YouTubeUploader:
                     logger.error(f"Authentication failed: {e}")
                     return False
 
-            # Save the credentials for future use
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(creds, token)
+        self._credentials = creds
 
-        # Build the YouTube API client
+        self._request_host = self.api_host
+        if self._request_host == 'auto':
+            self._request_host = _fastest_api_host(self._session)
+
+        # Build the YouTube API client while the token is saved. The
+        # discovery document bundled with googleapiclient is used, so no
+        # request is made to the discovery service
         try:
-            self.youtube = build('youtube', 'v3', credentials=creds)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                client = executor.submit(
+                    build,
+                    'youtube', 'v3',
+                    http=self._authorized_http(),
+                    requestBuilder=self._build_request,
+                    model=_json_model(),
+                    static_discovery=True,
+                    cache_discovery=False
+                )
+
+                # Save the credentials for future use
+                self._save_credentials()
+
+                self.youtube = client.result()
             logger.debug("YouTube API client initialized")
             return True
         except Exception as e:
@@ -122,26 +478,40 @@ class YouTubeUploader:
         Returns:
             Video ID if successful, None otherwise
         """
-        if not self.youtube:
-            logger.error("Not authenticated. Call authenticate() first.")
-            return None
+        metadata = self._shared_metadata(description, tags, category_id, privacy_status, made_for_kids)
+        return self._insert_video(video_file, title, metadata, notify_subscribers)
+
+    @staticmethod
+    def _shared_metadata(
+        description: str,
+        tags: Optional[list],
+        category_id: str,
+        privacy_status: str,
+        made_for_kids: bool
+    ) -> Dict:
+        """
+        Build the video metadata that doesn't depend on the file (everything but the title).
 
-        if not video_file.exists():
-            logger.error(f"Video file not found: {video_file}")
-            return None
+        Args:
+            description: Video description
+            tags: List of tags/keywords
+            category_id: YouTube category ID
+            privacy_status: 'public', 'private', or 'unlisted'
+            made_for_kids: Whether the video is made for kids
 
+        Returns:
+            Request body without a title
+        """
         # Default tags if none provided
         if tags is None:
             tags = ['Shorts', 'YouTube Shorts']
 
         # Add #Shorts to description if not present (important for YouTube Shorts detection)
-        if '#Shorts' not in description and '#shorts' not in description:
+        if not _SHORTS_RE.search(description):
             description = f"{description}\n\n#Shorts" if description else "#Shorts"
 
-        # Prepare video metadata
-        body = {
+        return {
             'snippet': {
-                'title': title[:100],  # YouTube title limit
                 'description': description[:5000],  # YouTube description limit
                 'tags': tags,
                 'categoryId': category_id
@@ -149,40 +519,97 @@ class YouTubeUploader:
             'status': {
                 'privacyStatus': privacy_status,
                 'selfDeclaredMadeForKids': made_for_kids
-            },
-            'notifySubscribers': notify_subscribers
+            }
         }
 
-        # Prepare the media file upload
-        media = MediaFileUpload(
-            str(video_file),
-            mimetype='video/*',
-            resumable=True,
-            chunksize=1024 * 1024  # 1MB chunks
-        )
+    def _insert_video(
+        self,
+        video_file: Path,
+        title: str,
+        metadata: Dict,
+        notify_subscribers: bool
+    ) -> Optional[str]:
+        """
+        Upload a video with the given title and shared metadata.
+
+        Args:
+            video_file: Path to the video file to upload
+            title: Video title
+            metadata: Request body from _shared_metadata (not modified)
+            notify_subscribers: Whether to notify subscribers about the upload
+
+        Returns:
+            Video ID if successful, None otherwise
+        """
+        from googleapiclient.errors import HttpError
+
+        if not self.youtube:
+            logger.error("Not authenticated. Call authenticate() first.")
+            return None
+
+        # Check the file before starting an upload session, so a missing or
+        # empty file (e.g. a failed encode) doesn't cost an API request
+        try:
+            file_size = video_file.stat().st_size
+        except FileNotFoundError:
+            logger.error(f"Video file not found: {video_file}")
+            return None
+
+        if file_size == 0:
+            logger.error(f"Video file is empty: {video_file}")
+            return None
+
+        # Add the title to a copy of the shared metadata
+        body = {
+            **metadata,
+            'snippet': {**metadata['snippet'], 'title': title[:100]}  # YouTube title limit
+        }
+        privacy_status = body['status']['privacyStatus']
+
+        # Tiny files go in one multipart request, small files in one resumable
+        # upload request, larger ones in big chunks
+        resumable = file_size >= MULTIPART_UPLOAD_THRESHOLD
+        if file_size < SMALL_UPLOAD_THRESHOLD:
+            chunksize = -1
+        else:
+            chunksize = UPLOAD_CHUNK_SIZE
 
         try:
             logger.info(f"Uploading video: {video_file.name}")
             logger.info(f"  Title: {title}")
             logger.info(f"  Privacy: {privacy_status}")
 
-            # Execute the upload
-            request = self.youtube.videos().insert(
-                part=','.join(body.keys()),
-                body=body,
-                media_body=media
-            )
-
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    logger.info(f"  Upload progress: {progress}%")
+            with _map_file(video_file) as mapped:
+                # Prepare the media file upload
+                media = _mapped_media_upload(mapped, chunksize, resumable)
+
+                # Execute the upload
+                request = self.youtube.videos().insert(
+                    part=_UPLOAD_PARTS,
+                    body=body,
+                    media_body=media,
+                    notifySubscribers=notify_subscribers
+                )
+
+                # A multipart upload completes in one request
+                response = None if resumable else request.execute()
+                log_progress = logger.isEnabledFor(logging.INFO)
+                last_progress = 0
+                while response is None:
+                    status, response = request.next_chunk()
+                    if status and log_progress:
+                        progress = int(status.progress() * 100)
+                        if progress >= last_progress + PROGRESS_LOG_STEP:
+                            logger.info(f"  Upload progress: {progress}%")
+                            last_progress = progress
 
             video_id = response['id']
             video_url = f"https://www.youtube.com/shorts/{video_id}"
 
+            # Keep the token if it was refreshed during the upload, so the
+            # next run can reuse it instead of refreshing again
+            self._save_credentials()
+
             logger.info(f"✓ Upload successful!")
             logger.info(f"  Video ID: {video_id}")
             logger.info(f"  URL: {video_url}")
@@ -194,7 +621,7 @@ class YouTubeUploader:
             if e.resp.status == 403:
                 logger.error("Permission denied. Check API quota and OAuth scopes.")
             elif e.resp.status == 401:
-                logger.error("Authentication failed. Try deleting token.pickle and re-authenticating.")
+                logger.error("Authentication failed. Try deleting token.json and re-authenticating.")
             return None
         except Exception as e:
             logger.error(f"Upload failed: {e}")
@@ -222,7 +649,7 @@ class YouTubeUploader:
             Video ID if successful, None otherwise
         """
         if title is None:
-            title = video_file.stem.replace('_', ' ').title()
+            title = _default_title(video_file)
 
         return self.upload_video(
             video_file=video_file,
@@ -234,6 +661,41 @@ class YouTubeUploader:
             notify_subscribers=False
         )
 
+    def upload_many(
+        self,
+        video_files: Iterable[Path],
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
+        title: Optional[str] = None,
+        description: str = "",
+        tags: Optional[list] = None,
+        privacy_status: str = "private"
+    ) -> List[Optional[str]]:
+        """
+        Upload several YouTube Shorts concurrently.
+
+        The metadata shared by all videos is built once, and each upload
+        only adds its title.
+
+        Args:
+            video_files: Paths to the video files to upload
+            max_workers: Number of uploads to run at once
+            title: Video title (defaults to each filename if not provided)
+            description: Video description
+            tags: List of tags/keywords
+            privacy_status: 'public', 'private', or 'unlisted'
+
+        Returns:
+            Video ID (or None on failure) for each file, in order
+        """
+        metadata = self._shared_metadata(description, tags, DEFAULT_CATEGORY_ID, privacy_status, False)
+
+        def upload(video_file: Path) -> Optional[str]:
+            video_title = title if title is not None else _default_title(video_file)
+            return self._insert_video(video_file, video_title, metadata, notify_subscribers=False)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(upload, video_files))
+
 
 def upload_to_youtube(
     video_file: Path,
@@ -242,7 +704,8 @@ def upload_to_youtube(
     tags: Optional[list] = None,
     privacy_status: str = "private",
     credentials_file: str = 'client_secrets.json',
-    token_file: str = 'token.pickle'
+    token_file: str = 'token.json',
+    api_host: Optional[str] = None
 ) -> Optional[str]:
     """
     Simplified function to upload a video to YouTube.
@@ -255,11 +718,12 @@ def upload_to_youtube(
         privacy_status: 'public', 'private', or 'unlisted'
         credentials_file: Path to OAuth2 credentials
         token_file: Path to token cache file
+        api_host: API host, "auto" to pick the fastest, or None for the default
 
     Returns:
         Video ID if successful, None otherwise
     """
-    uploader = YouTubeUploader(credentials_file, token_file)
+    uploader = YouTubeUploader(credentials_file, token_file, api_host)
 
     if not uploader.authenticate():
         return None
@@ -271,3 +735,52 @@ def upload_to_youtube(
         tags=tags,
         privacy_status=privacy_status
     )
+
+
+def upload_many_to_youtube(
+    video_files: Iterable[Path],
+    title: Optional[str] = None,
+    description: str = "",
+    tags: Optional[list] = None,
+    privacy_status: str = "private",
+    credentials_file: str = 'client_secrets.json',
+    token_file: str = 'token.json',
+    max_workers: int = DEFAULT_UPLOAD_WORKERS,
+    api_host: Optional[str] = None
+) -> List[Optional[str]]:
+    """
+    Simplified function to upload several videos to YouTube concurrently.
+
+    Authenticates once and shares the session across all uploads.
+
+    Args:
+        video_files: Paths to the video files
+        title: Video title (defaults to each filename)
+        description: Video description
+        tags: List of tags
+        privacy_status: 'public', 'private', or 'unlisted'
+        credentials_file: Path to OAuth2 credentials
+        token_file: Path to token cache file
+        max_workers: Number of uploads to run at once
+        api_host: API host, "auto" to pick the fastest, or None for the default
+
+    Returns:
+        Video ID (or None on failure) for each file, in order
+    """
+    video_files = list(video_files)
+    if not video_files:
+        return []
+
+    uploader = YouTubeUploader(credentials_file, token_file, api_host)
+
+    if not uploader.authenticate():
+        return [None] * len(video_files)
+
+    return uploader.upload_many(
+        video_files,
+        max_workers=max_workers,
+        title=title,
+        description=description,
+        tags=tags,
+        privacy_status=privacy_status
+    )
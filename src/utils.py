@@ -2,14 +2,26 @@
 Utility functions for Shortify.
 """
 
+import hashlib
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List
 
 
 # Supported video extensions
 VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".flv", ".wmv", ".webm", ".m4v"}
 
+# Same extensions as a tuple for str.endswith
+_VIDEO_EXTENSIONS_TUPLE = tuple(VIDEO_EXTENSIONS)
+
+# Number of directories scanned at once by get_video_files_many
+DEFAULT_SCAN_WORKERS = 8
+
 
 def setup_logging(verbose: bool = False) -> None:
     """
@@ -36,13 +48,103 @@ def get_video_files(directory: Path) -> List[Path]:
     Returns:
         List of video file paths
     """
-    video_files = []
+    # scandir reports the file type from the directory listing, so only
+    # symlinks need a stat()
+    with os.scandir(directory) as entries:
+        video_entries = [
+            entry for entry in entries
+            if entry.name.lower().endswith(_VIDEO_EXTENSIONS_TUPLE)
+            and entry.is_file()
+        ]
+
+    # Sort alphabetically. All entries share a parent, so comparing the
+    # name strings gives the same order as comparing the paths, but
+    # without going through Path's comparison
+    video_entries.sort(key=attrgetter('name'))
+
+    return [Path(entry.path) for entry in video_entries]
+
+
+def get_video_files_many(directories: Iterable[Path], workers: int = DEFAULT_SCAN_WORKERS) -> List[Path]:
+    """
+    Get all video files from several directories.
+
+    The directories are scanned concurrently, which hides the latency of
+    each directory listing on network filesystems.
+
+    Args:
+        directories: Directories to search
+        workers: Maximum number of directories scanned at once
 
-    for file_path in directory.iterdir():
-        if file_path.is_file() and file_path.suffix.lower() in VIDEO_EXTENSIONS:
-            video_files.append(file_path)
+    Returns:
+        List of video file paths, sorted by file name
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        video_files = list(chain.from_iterable(executor.map(get_video_files, directories)))
 
-    # Sort alphabetically
-    video_files.sort()
+    video_files.sort(key=attrgetter('name'))
 
     return video_files
+
+
+def cache_key(input_path: Path, params: Dict) -> str:
+    """
+    Build a key identifying an output made from an input file with given settings.
+
+    The key changes when the input file is modified or replaced (mtime, size)
+    or when any setting changes, but not when the input is renamed.
+
+    Args:
+        input_path: Path to the input file
+        params: Settings that affect the output (must be JSON-serializable)
+
+    Returns:
+        Short hex digest
+    """
+    stat = input_path.stat()
+    payload = json.dumps([stat.st_mtime_ns, stat.st_size, params], sort_keys=True)
+
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def cache_key_file(output_file: Path) -> Path:
+    """
+    Get the sidecar file storing the cache key of an output.
+
+    Args:
+        output_file: Path to the output file
+
+    Returns:
+        Path to the sidecar .key file
+    """
+    return output_file.with_name(f"{output_file.name}.key")
+
+
+def is_cached(output_file: Path, key: str) -> bool:
+    """
+    Check whether an output exists and was made with the given cache key.
+
+    Args:
+        output_file: Path to the output file
+        key: Expected cache key
+
+    Returns:
+        True if the output can be reused
+    """
+    key_file = cache_key_file(output_file)
+
+    if not output_file.exists() or not key_file.exists():
+        return False
+
+    return key_file.read_text().strip() == key
+
+
+def save_cache_key(output_file: Path, key: str) -> None:
+    """
+    Record the cache key an output was made with.
+
+    Args:
+        output_file: Path to the output file
+        key: Cache key to store
+    """
+    cache_key_file(output_file).write_text(key)